@@ -2,6 +2,8 @@
 
 It's used to pack the pseudocode of a function and encode it into a string, so that the pseudocode can be stored in the code and the source code will not be lose after pre-compiled and moved.
 
+The pack is generated from the source lines and matched with the dumped pack encoded on first access of the pack, rather than at decoration, so the warning that the dumped pack encoded need to be updated is raised on first access too, and never for a pack never accessed.
+
   Typical usage example:
 '''
 
@@ -9,11 +11,30 @@ __all__ = ["pseudocode", "pseudocode_pack_base"]
 
 import zlib
 import json
+import base64
+import codecs
 import re
 import inspect
+import linecache
+import sys
 from types import *
 from warnings import warn
-from functools import wraps
+from functools import wraps, lru_cache, cached_property, partial
+from operator import itemgetter
+from itertools import chain
+
+try:
+    import deflate as _deflate
+except ImportError:
+    _deflate = None
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+## sentinel for the attributes missing, as None may be an attribute value
+_MISSING = object()
 
 
 def subdict(obj: object, keys: list[str]) -> dict[str, object]:
@@ -26,15 +47,247 @@ def subdict(obj: object, keys: list[str]) -> dict[str, object]:
     return:
     dict[str, object], the sub dict of attributes of obj with keys
     '''
-    return {key: getattr(obj, key) for key in keys if hasattr(obj, key)}
+    return {
+        key: value
+        for key in keys
+        if (value := getattr(obj, key, _MISSING)) is not _MISSING
+    }
+
+
+def get_sourcelines(func: FunctionType) -> list[str]:
+    '''return the source lines of func with its decorators, like `inspect.getsourcelines`
+
+    The lines are read from `linecache` and the block is cut by `inspect.getblock` from the first line of func, the same as `inspect.getsourcelines`, without looking up the source file and searching for the first line again.
+
+    parameters:
+    func: FunctionType, the function to get source lines
+
+    return:
+    list[str], the source lines of func
+
+    raise:
+    OSError, if the source lines can not be got
+    '''
+    func = inspect.unwrap(func)
+    code = func.__code__
+    linecache.checkcache(code.co_filename)
+    lines = linecache.getlines(code.co_filename, func.__globals__)
+    ## co_firstlineno is the line of the first decorator, or of def without decorator
+    head = code.co_firstlineno - 1
+    if not 0 <= head < len(lines):
+        raise OSError("could not get source code")
+    return inspect.getblock(lines[head:])
+
+
+@lru_cache(maxsize=1024)
+def compile_func_pattern(pattern_format: str,
+                         func_name: str,
+                         flags: int = 0) -> re.Pattern:
+    '''return the compiled pattern formatted with the func name, cached for the same func name
+
+    parameters:
+    pattern_format: str, the pattern with `{func_name}` to format
+    func_name: str, the name of the function
+    flags: int, the flags to compile the pattern with
+
+    return:
+    re.Pattern, the compiled pattern
+    '''
+    return re.compile(pattern_format.format(func_name=re.escape(func_name)),
+                      flags)
 
 
 PSEUDOCODE_DEFAULT_ENCODING = "utf-8"
+PSEUDOCODE_LENGTH_BYTES = 4
+
+
+def pack_compress(source_bytes: bytes) -> bytes:
+    '''compress the source bytes into raw deflate, with libdeflate if available or zlib otherwise
+
+    parameters:
+    source_bytes: bytes, the bytes to compress
+
+    return:
+    bytes, the length of the source bytes followed by the compressed bytes
+    '''
+    if _deflate is not None:
+        compressed_bytes = _deflate.deflate_compress(source_bytes, 12)
+    else:
+        ## negative wbits for raw deflate without zlib header and checksum
+        compressor = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+        compressed_bytes = compressor.compress(
+            source_bytes) + compressor.flush()
+    return len(source_bytes).to_bytes(PSEUDOCODE_LENGTH_BYTES,
+                                      "big") + compressed_bytes
+
+
+def pack_decompress(compressed_bytes: bytes) -> bytes:
+    '''decompress the bytes compressed by `pack_compress`
+
+    parameters:
+    compressed_bytes: bytes, the length of the source bytes followed by the compressed bytes
+
+    return:
+    bytes, the source bytes
+    '''
+    source_length = int.from_bytes(compressed_bytes[:PSEUDOCODE_LENGTH_BYTES],
+                                   "big")
+    compressed_bytes = compressed_bytes[PSEUDOCODE_LENGTH_BYTES:]
+    if _deflate is not None:
+        return _deflate.deflate_decompress(compressed_bytes, source_length)
+    return zlib.decompress(compressed_bytes, -zlib.MAX_WBITS,
+                           max(source_length, 1))
+
+
+def use_orjson(encoding: str) -> bool:
+    '''whether the json bytes in encoding are dumped and loaded with orjson, which only does utf-8
+
+    parameters:
+    encoding: str, the encoding of the json bytes
+
+    return:
+    bool, whether orjson is available and the encoding is utf-8
+    '''
+    return _orjson is not None and codecs.lookup(encoding).name == "utf-8"
+
+
+def pack_dumps(sourcepack: list,
+               encoding: str = PSEUDOCODE_DEFAULT_ENCODING) -> bytes:
+    '''dump the source pack into json bytes, with orjson if available and the encoding is utf-8 or json otherwise
+
+    parameters:
+    sourcepack: list, the source pack to dump
+    encoding: str, the encoding of the json bytes
+
+    return:
+    bytes, the json bytes of the source pack
+    '''
+    if use_orjson(encoding):
+        return _orjson.dumps(sourcepack)
+    return json.dumps(sourcepack, separators=(',', ':')).encode(encoding)
+
+
+def pack_loads(source_bytes: bytes,
+               encoding: str = PSEUDOCODE_DEFAULT_ENCODING) -> list:
+    '''load the source pack from json bytes dumped by `pack_dumps`
+
+    parameters:
+    source_bytes: bytes, the json bytes of the source pack
+    encoding: str, the encoding of the json bytes
+
+    return:
+    list, the source pack
+    '''
+    if use_orjson(encoding):
+        return _orjson.loads(source_bytes)
+    return json.loads(source_bytes.decode(encoding))
+
+
+def pack_dumps_chunks(sourcepack: list,
+                      encoding: str = PSEUDOCODE_DEFAULT_ENCODING):
+    '''dump the source pack into json bytes chunk by chunk, one block per chunk, joined the same as `pack_dumps`
+
+    It's only used by `pack_dumps_compressed` on the zlib fallback. With libdeflate, the json bytes are dumped whole by `pack_dumps` and compressed in one shot, so no chunk is dumped.
+
+    parameters:
+    sourcepack: list, the source pack to dump
+    encoding: str, the encoding of the json bytes
+
+    return:
+    Iterator[bytes], the chunks of the json bytes of the source pack
+    '''
+    if use_orjson(encoding):
+        for index, block in enumerate(sourcepack):
+            yield (b"," if index else b"[") + _orjson.dumps(block)
+        yield b"]" if sourcepack else b"[]"
+        return
+
+    ## encode incrementally so that the byte order mark is only leading
+    encoder = codecs.getincrementalencoder(encoding)()
+    for index, block in enumerate(sourcepack):
+        yield encoder.encode(("," if index else "[") +
+                             json.dumps(block, separators=(',', ':')))
+    yield encoder.encode("]" if sourcepack else "[]", final=True)
+
+
+def pack_dumps_compressed(
+        sourcepack: list,
+        encoding: str = PSEUDOCODE_DEFAULT_ENCODING) -> bytes:
+    '''dump the source pack into json bytes and compress them like `pack_compress`
+
+    The json bytes are only streamed on the zlib fallback, where the json bytes of each block are fed to the compressor as soon as dumped, so the whole json bytes are never materialized. With libdeflate, which only compresses in one shot, the json bytes are dumped whole by `pack_dumps` and nothing is streamed.
+
+    parameters:
+    sourcepack: list, the source pack to dump
+    encoding: str, the encoding of the json bytes
+
+    return:
+    bytes, the length of the json bytes followed by the compressed bytes
+    '''
+    if _deflate is not None:
+        return pack_compress(pack_dumps(sourcepack, encoding=encoding))
+
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+    compressed_chunks = []
+    source_length = 0
+    for source_chunk in pack_dumps_chunks(sourcepack, encoding=encoding):
+        source_length += len(source_chunk)
+        compressed_chunks.append(compressor.compress(source_chunk))
+    compressed_chunks.append(compressor.flush())
+    return source_length.to_bytes(PSEUDOCODE_LENGTH_BYTES,
+                                  "big") + b"".join(compressed_chunks)
+
+
+class warned_property:
+    '''property of the pack, read through `_try_warning` of the pack
+
+    Once the pack is known in sync, the value is set as a plain attribute of the pack over the property, so that the later reads skip `_try_warning` at all.
+    '''
+
+    def __init__(self, func: FunctionType):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, instance: object, owner: type | None = None):
+        if instance is None:
+            return self
+        value = self.func(instance._try_warning())
+        if not instance._warning_update:
+            instance.__dict__[self.name] = value
+        return value
+
+
+def build_rule(pattern: dict[str, tuple]) -> dict[str, object]:
+    '''build the rule from the pattern of `pseudocode_rule` in one dict
+
+    parameters:
+    pattern: dict[str, tuple], the pattern of prefix_str, is_code_pre-compiled, clip_slice, pattern
+
+    return:
+    dict[str, object], the rule with the keys suffixed by "_code", "_code_compiled", "_pattern", "_slice" and "_pattern_compiled"
+    '''
+    rule = {}
+    for key, (prefix_str, is_code_compiled, clip_slice,
+              pattern_str) in pattern.items():
+        code = prefix_str % pattern_str
+        rule[key + "_code"] = code
+        if is_code_compiled:
+            rule[key + "_code_compiled"] = re.compile(code)
+        rule[key + "_pattern"] = pattern_str
+        rule[key + "_slice"] = clip_slice
+        rule[key + "_pattern_compiled"] = re.compile(pattern_str)
+    return rule
 
 
 class pseudocode_pack_base:
     '''base class for pseudocode pack'''
 
+    ## tag leading the base85 pack encoded, the hex pack encoded of older version has no tag
+    PACK_B85_TAG = "!"
+
     class pseudocode_rule:
         '''rule for pseudocode
         
@@ -50,28 +303,11 @@ class pseudocode_pack_base:
             ("\s*def\s*{func_name}%s", False, slice(1, -2), "\(.*\):"),
             "marker": ("\s*%s", True, slice(3, None), "###\s*.*\s*"),
         }
-        pattern_code = {
-            key + "_code": value[0] % value[-1]
-            for key, value in pattern.items()
-        }
-        pattern_pattern = {
-            key + "_pattern": value[-1]
-            for key, value in pattern.items()
-        }
-        pattern_slice = {
-            key + "_slice": value[-2]
-            for key, value in pattern.items()
-        }
-        pattern_code_compiled = {
-            key + "_code_compiled": re.compile(value[0] % value[-1])
-            for key, value in pattern.items() if value[1]
-        }
-        pattern_pattern_compiled = {
-            key + "_pattern_compiled": re.compile(value[-1])
-            for key, value in pattern.items()
-        }
-        rule = dict(**pattern_code, **pattern_code_compiled, **pattern_pattern,
-                    **pattern_slice, **pattern_pattern_compiled)
+        trailing_space_compiled = re.compile(r"[^\S\n]+$", re.MULTILINE)
+        blank_lines_compiled = re.compile(r"\n{2,}")
+        indent_compiled = re.compile(r"\s*")
+
+        rule = build_rule(pattern)
 
         def clip_pattern(self, attr: str, line: str) -> str:
             return getattr(self, attr +
@@ -79,7 +315,7 @@ class pseudocode_pack_base:
                                self, attr + "_slice")].strip()
 
         def __init__(self):
-            '''init the rule'''
+            ## init pattern
             self.__dict__.update(self.__class__.rule)
 
         def deal_with(self, pseudocode_sourcelines: list[str],
@@ -94,44 +330,70 @@ class pseudocode_pack_base:
             list[str], the source lines of pseudocode after dealing with the rule
             '''
 
-            pseudocode_sourcelines = [
-                line.rstrip() for line in pseudocode_sourcelines
-                if not line.isspace()
-            ]
-            ## get the head line of function def
-            start_marker_code_compiled = re.compile(
-                self.start_marker_code.format(func_name=func.__name__))
-            head = 0
-            while start_marker_code_compiled.fullmatch(
-                    pseudocode_sourcelines[head]) is None:
-                head += 1
+            ## rstrip the lines and remove the blank lines by re on the joined source
+            pseudocode_source = self.__class__.blank_lines_compiled.sub(
+                "\n",
+                self.__class__.trailing_space_compiled.sub(
+                    "", "\n".join(pseudocode_sourcelines))).strip("\n")
+            pseudocode_sourcelines = pseudocode_source.split("\n")
+            ## get the head line of function def, searched in the joined source
+            ## with no blank line left, a match never crosses the lines
+            start_marker_code_compiled = compile_func_pattern(
+                "^(?:" + self.start_marker_code + ")$", func.__name__,
+                re.MULTILINE)
+            start_marker_match = start_marker_code_compiled.search(
+                pseudocode_source)
+            if start_marker_match is None:
+                raise ValueError("could not find the def line of {}".format(
+                    func.__name__))
+            head = pseudocode_source.count("\n", 0, start_marker_match.start())
 
             ## get start_marker
             def_str = pseudocode_sourcelines[head]
-            start_marker = self.clip_pattern("start_marker", def_str)
+            ## markers are interned to be shared among packs
+            start_marker = sys.intern(
+                self.clip_pattern("start_marker", def_str))
 
             ## get the source pack
             pack = [[start_marker, []]]
             indents = []
 
+            ## bind the methods used for each line once out of the loop
+            marker_fullmatch = self.marker_code_compiled.fullmatch
+            clip_marker = partial(self.clip_pattern, "marker")
+            indent_match = self.__class__.indent_compiled.match
+
             for line in pseudocode_sourcelines[head + 1:]:
-                if self.marker_code_compiled.fullmatch(line) is not None:
+                if marker_fullmatch(line) is not None:
                     ## pack
-                    marker = self.clip_pattern("marker", line)
+                    marker = sys.intern(clip_marker(line))
                     pack.append([marker, []])
                 else:
                     pack[-1][-1].append(line)
 
-                    line_indent = line.find(line.lstrip())
+                    line_indent = indent_match(line).end()
                     indents.append(line_indent)
 
             ## remove indent
             least_indent = min(indents)
+            dedent = itemgetter(slice(least_indent, None))
             for block in pack:
-                block[-1] = [line[least_indent:] for line in block[-1]]
+                block[-1][:] = map(dedent, block[-1])
 
             return pack
 
+    ## rule shared by the packs of the class, built by `_get_rule`
+    _rule_singleton = None
+
+    @classmethod
+    def _get_rule(cls) -> "pseudocode_pack_base.pseudocode_rule":
+        '''return the rule shared by the packs of cls, built on first call'''
+        ## looked up in cls only, so that a subclass does not share the rule of its base
+        rule = cls.__dict__.get("_rule_singleton")
+        if rule is None:
+            rule = cls._rule_singleton = cls.pseudocode_rule()
+        return rule
+
     @classmethod
     def generate_pack_encoded(
             cls,
@@ -148,13 +410,27 @@ class pseudocode_pack_base:
         return:
         str, the pack encoded
         '''
-        pseudocode_sourcepack = cls.pseudocode_rule().deal_with(
+        pseudocode_sourcepack = cls._get_rule().deal_with(
             pseudocode_sourcelines, func)
+        return cls.pack_encode(pseudocode_sourcepack, encoding=encoding)
 
-        source_bytes = json.dumps(pseudocode_sourcepack,
-                                  separators=(',', ':')).encode(encoding)
-        source_compressed_bytes = zlib.compress(source_bytes)
-        return source_compressed_bytes.hex()
+    @classmethod
+    def pack_encode(cls,
+                    pseudocode_sourcepack: list,
+                    encoding: str = PSEUDOCODE_DEFAULT_ENCODING) -> str:
+        '''encode the source pack into the pack encoded
+
+        parameters:
+        pseudocode_sourcepack: list, the source pack
+        encoding: str, the encoding of the pack
+
+        return:
+        str, the pack encoded
+        '''
+        source_compressed_bytes = pack_dumps_compressed(pseudocode_sourcepack,
+                                                        encoding=encoding)
+        return cls.PACK_B85_TAG + base64.b85encode(
+            source_compressed_bytes).decode("ascii")
 
     @classmethod
     def pack_decode_from(cls,
@@ -169,45 +445,133 @@ class pseudocode_pack_base:
         return:
         list, the source pack of the pack
         '''
-        source_bytes = zlib.decompress(bytes.fromhex(pseudocode_pack_encoded))
-        sourcepack = json.loads(source_bytes.decode(encoding))
+        if pseudocode_pack_encoded.startswith(cls.PACK_B85_TAG):
+            source_compressed_bytes = base64.b85decode(
+                pseudocode_pack_encoded[len(cls.PACK_B85_TAG):])
+            source_bytes = pack_decompress(source_compressed_bytes)
+        else:
+            ## the hex pack encoded of older version is zlib compressed
+            source_bytes = zlib.decompress(
+                bytes.fromhex(pseudocode_pack_encoded))
+        sourcepack = pack_loads(source_bytes, encoding=encoding)
+        ## markers are interned to be shared among packs
+        for block in sourcepack:
+            block[0] = sys.intern(block[0])
         return sourcepack
 
+    @classmethod
+    def pack_match(cls,
+                   pseudocode_sourcepack: list,
+                   pseudocode_pack_encoded: str | None,
+                   encoding: str = PSEUDOCODE_DEFAULT_ENCODING) -> bool:
+        '''whether the pack encoded holds the source pack
+
+        parameters:
+        pseudocode_sourcepack: list, the source pack
+        pseudocode_pack_encoded: str | None, the pack encoded
+        encoding: str, the encoding of the pack
+
+        return:
+        bool, whether the pack encoded holds the source pack
+        '''
+        if pseudocode_pack_encoded is None:
+            return False
+        try:
+            return pseudocode_sourcepack == cls.pack_decode_from(
+                pseudocode_pack_encoded, encoding=encoding)
+        except Exception:
+            ## a broken pack encoded needs to be updated as well
+            return False
+
     WRAPPER_ASSIGNMENTS = ('__module__', '__name__', '__qualname__', '__doc__')
 
     def __init__(self,
-                 origin_pseudocode_pack_encoded: str,
-                 warning_update: bool = False,
+                 origin_pseudocode_pack_encoded: str | None,
+                 warning_update: bool | None = False,
                  func: FunctionType | None = None,
-                 encoding: str = PSEUDOCODE_DEFAULT_ENCODING):
+                 encoding: str = PSEUDOCODE_DEFAULT_ENCODING,
+                 pseudocode_sourcelines: list[str] | None = None,
+                 dumped_pseudocode_pack_encoded: str | None = None):
         '''init the pack
 
         parameters:
-        origin_pseudocode_pack_encoded: str, the pack encoded
-        warning_update: bool, whether to warn the update
+        origin_pseudocode_pack_encoded: str | None, the pack encoded, or None to generate it from pseudocode_sourcelines on first access
+        warning_update: bool | None, whether to warn the update, or None to match the pack with dumped_pseudocode_pack_encoded on first access
+        func: FunctionType | None, the function of the pseudocode
         encoding: str, the encoding of the pack
+        pseudocode_sourcelines: list[str] | None, the source lines of func to generate the pack from on first access
+        dumped_pseudocode_pack_encoded: str | None, the dumped pack encoded to match the pack with
         '''
-        self._origin_pack_encoded = origin_pseudocode_pack_encoded
-        self._warning_update = warning_update
+        self._dumped_pack_encoded = dumped_pseudocode_pack_encoded
+        ## the source lines and func are only held until the source pack is dealt with
+        self._pseudocode_sourcelines = pseudocode_sourcelines
+        self._func = func if pseudocode_sourcelines is not None else None
         self.encoding = encoding
-
-        self._source_pack = self.__class__.pack_decode_from(
-            origin_pseudocode_pack_encoded, encoding=encoding)
-        self._dict_index = {
-            block[0]:block[1] for block in self._source_pack
-        }
+        ## the known values are set over the cached properties
+        ## without source lines, the pack encoded is never generated even if None
+        if (origin_pseudocode_pack_encoded is not None
+                or pseudocode_sourcelines is None):
+            self._origin_pack_encoded = origin_pseudocode_pack_encoded
+        if warning_update is not None:
+            self._warning_update = warning_update
+        ## the pack known in sync holds the pack encoded as a plain attribute
+        if (warning_update is False
+                and origin_pseudocode_pack_encoded is not None):
+            self.origin_pack_encoded = origin_pseudocode_pack_encoded
 
         ## update wrapper
         if func is not None:
             for attr in self.__class__.WRAPPER_ASSIGNMENTS:
                 setattr(self, attr, getattr(func, attr))
 
-        self._try_warning()
-    
+        ## the warning known to fire is formatted and fired once here
+        if warning_update:
+            self._warning_update_info = self._format_warning_update_info()
+            self._try_warning()
+
+    @cached_property
+    def _source_pack(self) -> list:
+        '''the source pack dealt with from the source lines or decoded on first access'''
+        if self._pseudocode_sourcelines is not None:
+            source_pack = self.__class__._get_rule().deal_with(
+                self._pseudocode_sourcelines, self._func)
+            self._pseudocode_sourcelines = self._func = None
+            return source_pack
+        return self.__class__.pack_decode_from(self._origin_pack_encoded,
+                                               encoding=self.encoding)
+
+    @cached_property
+    def _origin_pack_encoded(self) -> str:
+        '''the pack encoded from the source pack on first access'''
+        return self.__class__.pack_encode(self._source_pack,
+                                          encoding=self.encoding)
+
+    @cached_property
+    def _warning_update(self) -> bool:
+        '''whether the dumped pack encoded needs to be updated, matched on first access'''
+        warning_update = not self.__class__.pack_match(
+            self._source_pack, self._dumped_pack_encoded, encoding=self.encoding)
+        if warning_update:
+            self._warning_update_info = self._format_warning_update_info()
+        return warning_update
+
+    @cached_property
+    def _dict_index(self) -> dict[str, list[str]]:
+        '''the source lines of blocks indexed by marker, built on first access'''
+        ## blocks are [marker, lines] pairs, which dict takes directly
+        return dict(self._source_pack)
+
+    @cached_property
+    def _all_lines(self) -> tuple[str, ...]:
+        '''the source lines of all blocks, chained on first access'''
+        return tuple(
+            chain.from_iterable(block[1] for block in self._source_pack))
+
     def __getitem__(self,index:str):
-        return self._dict_index[index]
+        return self._try_warning()._dict_index[index]
     
     def __call__(self,return_line:bool = False):
+        self._try_warning()
         if return_line:
             for block in self._source_pack:
                 for line in block[1]:
@@ -216,29 +580,35 @@ class pseudocode_pack_base:
             for block in self._source_pack:
                 yield block
 
+    def _format_warning_update_info(self) -> str:
+        '''return the info to warn the update'''
+        return '"{func_name}" need to be updated with: \n{head}"{origin_pack_encoded}"{tail}'.format(
+            func_name=self.__qualname__,
+            head="=" * 8 + "\n",
+            tail="\n" + "=" * 8,
+            origin_pack_encoded=self._origin_pack_encoded)
+
     def _try_warning(self):
         '''try to warn the update and return self'''
         if self._warning_update:
-            if not hasattr(self, "_warning_update_info"):
-                _warning_update_info = '"{func_name}" need to be updated with: \n{head}"{origin_pack_encoded}"{tail}'.format(
-                    func_name=self.__qualname__,
-                    head="=" * 8 + "\n",
-                    tail="\n" + "=" * 8,
-                    origin_pack_encoded=self._origin_pack_encoded)
-                self._warning_update_info = _warning_update_info
             warn(self._warning_update_info)
         return self
 
-    @property
+    @warned_property
     def origin_pack_encoded(self):
         '''return the origin pack encoded'''
-        return self.origin_pack_encoded
+        return self._origin_pack_encoded
 
-    @property
+    @warned_property
     def origin_pack_sourcepack(self):
         '''return the origin pack sourcelines'''
         return self._source_pack
 
+    @warned_property
+    def all_lines(self) -> tuple[str, ...]:
+        '''return the source lines of all blocks'''
+        return self._all_lines
+
 
 class pseudocode:
 
@@ -271,24 +641,27 @@ class pseudocode:
 
         ## get source pack list
         try:
-            source_lines = inspect.getsourcelines(func)[0]
+            source_lines = get_sourcelines(func)
             has_source_lines = True
         except OSError:
             has_source_lines = False
 
         ## build the pack
         if has_source_lines:
-            ## match source and dumped
-            source_pack_encoded = self.pack_base.generate_pack_encoded(
-                source_lines, func=func, encoding=self.encoding)
-            if source_pack_encoded != dumped_pack_encoded:
-                warning_update = True
-            else:
-                warning_update = False
-            pack = self.pack_base(source_pack_encoded, warning_update, func)
+            ## generate from source and match with dumped on first access
+            pack = self.pack_base(
+                None,
+                None,
+                func,
+                encoding=self.encoding,
+                pseudocode_sourcelines=source_lines,
+                dumped_pseudocode_pack_encoded=dumped_pack_encoded)
 
         else:
-            pack = self.pack_base(dumped_pack_encoded, False, func)
+            pack = self.pack_base(dumped_pack_encoded,
+                                  False,
+                                  func,
+                                  encoding=self.encoding)
 
         return pack
 
@@ -298,14 +671,14 @@ if __name__ == "__main__":
     class bibi:
 
         @pseudocode(
-            "789c8b8e562a4f2c57d289568a51ca4bcccd8c5152d2512a482c2e568a8d8d050084cb08f4"
+            "!0000Ti;h+*Pb^o`iB^hH%1g}6j8Rh3Q7T9*E>?<-jRgP"
         )
         def hoho(waw):
             "nami"
             pass
 
     @pseudocode(
-        "789c8b8e562acf2f57d289562a29aab4528a8d05b212f3f24b32528be273138bb2538b40720a40909d9f9aafa4a3945a919c5a50620564810413a313ad12538a63811a63018ae01732"
+        "!0000>9f?s2fItWZuM+Ru6L=MokP?EW3=_6)-`0E$Ga~5GL4wMMp*qZtsLgZUEt}`}ra=o25d2>JEC&72#MstLp{g$"
     )
     def hihi(wow):
         try:
@@ -314,5 +687,5 @@ if __name__ == "__main__":
         except:
             a[a:ads]
 
-    print([line for line in hihi(return_line=True)])
+    print(hihi.all_lines)
     print(bibi.hoho.origin_pack_sourcepack)